@@ -1,13 +1,233 @@
+import asyncio
+import atexit
 import logging
 import logging.handlers
+import json
+import locale
+import os
+import queue
 import re
 import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import partial, wraps
 from pathlib import Path
 
 from dateutil import parser
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_date_pattern = "(\d\d:\d\d:\d\d([T ]|'T')?)?\d{1,4}[./-]\d{1,2}[./-]\d{1,4}(([T ]|'T')\d\d:\d\d:\d\d)?"
+_date_regex = re.compile(_date_pattern)
+_epoch = datetime(1970, 1, 1)
+_encoding = locale.getpreferredencoding(False)
+
+
+def _get_line_date(line:str) -> datetime:
+    """Get any datetime that exists on a log line or return None"""
+    try:
+        linedate = parser.parse(line, fuzzy=True, ignoretz=True)
+    except Exception as excpt:  # Timestamp/level not found or multiple numbers
+        linedate = None  # remove any old value
+        if "Unknown string" in excpt.args[0]:  # here if multiple numbers found
+            linedate = _get_difficult_date(line)
+    return linedate
+
+def _get_difficult_date(line: str) -> datetime:
+    """If line contains more than 1 group of numbers parser.parse alone fails"""
+    try:
+        re_date = _date_regex.search(line)
+        return parser.parse(re_date.group(0), fuzzy=True, ignoretz=True)
+    except:
+        return None
+
+def _check_path(log, path: str) -> Path:
+    """ Get the logs path name and check the log exists"""
+    if path is None:
+        full_path = Path(log.path, f"{log.name}.log")
+    else:
+        full_path = Path(path)
+    if not full_path.is_file():
+        raise Exception(f'No log file at {full_path}')
+    return full_path
+
+def _get_search_level(level) -> int:
+    """Get the minimum search level as an int"""
+    try:
+        return logging._nameToLevel[level.upper()]  # log level to search for
+    except:
+        return 0
+
+def _get_line_level(line: str, levels: dict=None) -> str:
+    """Returns level found on this line or '' """
+    for level in levels or logging._nameToLevel:
+        if level in line:
+            return level
+    return ""
+
+def _query_level(level_str: str, search_level: int, levels: dict) -> bool:
+    """Is record above required level? Return True/False """
+    if level_str:
+        level_not_found = 50  # i.e. CRITICAL
+        return levels.get(level_str, level_not_found) >= search_level
+    return True   #  Level was ""
+
+def _query_text(line: str, search_text: str, ignorecase: bool) -> bool:
+    """Does record contain text? Return True/False"""
+    if search_text:
+        try:
+            return (search_text in line.casefold()) if ignorecase else (search_text in line)
+        except:
+            return False  # TODO: should we return True?
+    return True   # search text was ""
+
+def _query_save(line: str, search_text: str, ignorecase: bool, search_level: int, levels: dict) -> bool:
+    """Check if line should be saved and returns True/False """
+    if line:
+        level_str = _get_line_level(line, levels)
+        return _query_level(level_str, search_level, levels) and _query_text(line, search_text, ignorecase)
+    return False
+
+def _iter_records(lines):
+    """
+    Yield (timestamp, record) for each record in lines.  Lines without a
+    timestamp are added to the previous record (multiline messages)
+    """
+    timestamp, record = None, ""
+    for line in lines:
+        linedate = _get_line_date(line)
+        if linedate is None:  # then this is a multiline record
+            record = record + line if record else ''
+        else:
+            if record:
+                yield timestamp, record
+            timestamp, record = linedate, line
+    if record:
+        yield timestamp, record
+
+def _decode(line: bytes) -> str:
+    """Decode a line read in binary mode as open(mode='r') would"""
+    return line.decode(_encoding, errors='replace').replace('\r\n', '\n')
+
+def _read_lines(log_file, stop: int):
+    """Yield lines from a binary log file up to byte position stop"""
+    while log_file.tell() < stop:
+        line = log_file.readline()
+        if not line:
+            break
+        yield _decode(line)
+
+def _read_lines_reversed(log_file, block_size: int=1 << 20):
+    """Yield lines from a binary log file, last line first, reading large blocks from the end"""
+    position = log_file.seek(0, 2)
+    tail = b""   # start of the first line in the previous block, which may continue in this one
+    while position > 0:
+        size = min(block_size, position)
+        position -= size
+        log_file.seek(position)
+        lines = (log_file.read(size) + tail).splitlines(keepends=True)
+        tail = lines.pop(0) if position > 0 else b""
+        for line in reversed(lines):
+            yield _decode(line)
+
+def _iter_records_reversed(lines):
+    """
+    Yield (timestamp, record) for each record in lines read backwards e.g.
+    from _read_lines_reversed, so the last record comes first
+    """
+    continuation = []   # lines without a timestamp, last first
+    for line in lines:
+        linedate = _get_line_date(line)
+        if linedate is None:  # then this is part of a multiline record
+            continuation.append(line)
+        else:
+            yield linedate, line + "".join(reversed(continuation))
+            continuation = []
+
+def _get_chunks(log_path: Path, count: int, start_date: datetime, end_date: datetime) -> list:
+    """
+    Split a log into about count (begin, stop) byte ranges, each starting at
+    the beginning of a record, and drop ranges outside the search dates
+    """
+    size = log_path.stat().st_size
+    bounds = [(0, None)]   # (byte position, timestamp of first record)
+    with open(log_path, mode='rb') as log_file:
+        for index in range(1, count):
+            offset = size * index // count
+            if offset <= bounds[-1][0]:
+                continue
+            log_file.seek(offset - 1)
+            log_file.readline()   # move to start of the next line
+            position, timestamp = log_file.tell(), None
+            for line in iter(log_file.readline, b''):
+                timestamp = _get_line_date(_decode(line))
+                if timestamp is not None:
+                    break
+                position = log_file.tell()
+            if timestamp is None:
+                break   # no more records
+            if position > bounds[-1][0]:
+                bounds.append((position, timestamp))
+    chunks = []
+    for index, (begin, timestamp) in enumerate(bounds):
+        stop, next_timestamp = bounds[index + 1] if index + 1 < len(bounds) else (size, None)
+        if timestamp is not None and timestamp > end_date:
+            break   # this and later chunks are after the search dates
+        if next_timestamp is not None and next_timestamp < start_date:
+            continue   # all of this chunk is before the search dates
+        chunks.append((begin, stop))
+    return chunks
+
+def _find_chunk(log_path: Path, begin: int, stop: int, start_date: datetime, end_date: datetime,
+                query: tuple) -> tuple:
+    """
+    Search records between byte positions begin and stop of a log
+    Returns ([MSG[, ...]], True if a record after end_date was reached)
+    """
+    result = []
+    with open(log_path, mode='rb') as log_file:
+        log_file.seek(begin)
+        for timestamp, record in _iter_records(_read_lines(log_file, stop)):
+            if timestamp > end_date:
+                return result, True
+            if timestamp >= start_date and _query_save(record, *query):
+                result.append(record)
+    return result, False
+
+def _read_new_records(log_file, unfinished: bytes, pending: tuple, query: tuple) -> tuple:
+    """
+    Read whatever has been added to a binary log file since the last call.
+    pending is the last (timestamp, record) read, which may still get more
+    lines, so is only complete once the next record starts
+    Returns ([MSG[, ...]] complete and matching query, incomplete last line,
+             pending, True if anything was read)
+    """
+    if os.fstat(log_file.fileno()).st_size < log_file.tell():
+        log_file.seek(0)   # log was overwritten or rolled over - start again
+        unfinished, pending = b"", None
+    data = log_file.read()
+    lines = (unfinished + data).splitlines(keepends=True)
+    unfinished = lines.pop() if lines and not lines[-1].endswith((b"\n", b"\r")) else b""
+    records = []
+    for line in map(_decode, lines):
+        linedate = _get_line_date(line)
+        if linedate is None:  # then this is part of a multiline record
+            if pending:
+                pending = (pending[0], pending[1] + line)
+        else:
+            if pending and _query_save(pending[1], *query):
+                records.append(pending[1])
+            pending = (linedate, line)
+    return records, unfinished, pending, bool(data)
+
+def _get_seconds(date: datetime) -> float:
+    """Seconds from 1970-01-01 to the (naive) date as written in the log"""
+    return (date - _epoch).total_seconds()
+
 
 class ClassOrMethod(object):
     """Make method work as class or instance"""
@@ -20,6 +240,118 @@ class ClassOrMethod(object):
             return self.func(context, *args, **kw)
         return hybrid
 
+class LogColumns():
+    """
+    Log records stored as column arrays e.g. from mylog.find(as_columns=True)
+        seconds:    array('d') of record timestamps as seconds from 1970-01-01
+        timestamps: numpy datetime64 array if numpy is installed, otherwise seconds
+        levels:     array('H') of record log levels, LogColumns.no_level if none found
+        name_ids:   array('I') of indexes into names
+        names:      [logger name, ...] with each name stored once
+        offsets:    array('Q') of record start positions in buffer, plus its end
+        buffer:     str of all records joined together, see .message(index)
+    """
+    no_level = 0xFFFF   # levels code for records without a log level (NOTSET is 0)
+    version = 2         # sidecar layout, part of the key checked by .load()
+
+    def __init__(self):
+        self.seconds = array('d')
+        self.levels = array('H')
+        self.name_ids = array('I')
+        self.names = []
+        self.offsets = array('Q', [0])
+        self._buffer = ""
+        self._pending = []  # messages appended but not yet joined onto buffer
+        self._name_index = {}
+
+    def __len__(self):
+        return len(self.seconds)
+
+    def __iter__(self):
+        return (self.message(index) for index in range(len(self)))
+
+    @property
+    def buffer(self) -> str:
+        if self._pending:
+            self._buffer += "".join(self._pending)
+            self._pending = []
+        return self._buffer
+
+    @property
+    def timestamps(self):
+        if numpy is None:
+            return self.seconds
+        microseconds = numpy.round(numpy.asarray(self.seconds, dtype='float64') * 1e6)
+        return microseconds.astype('int64').astype('datetime64[us]')
+
+    def append(self, timestamp: datetime, level: str, name: str, message: str):
+        """Add one record to the end of the columns"""
+        if name not in self._name_index:
+            self._name_index[name] = len(self.names)
+            self.names.append(name)
+        self.seconds.append(_get_seconds(timestamp))
+        self.levels.append(logging._nameToLevel[level] if level else self.no_level)
+        self.name_ids.append(self._name_index[name])
+        self._pending.append(message)
+        self.offsets.append(self.offsets[-1] + len(message))
+
+    def message(self, index: int) -> str:
+        """Full text of record number index"""
+        return self.buffer[self.offsets[index]:self.offsets[index + 1]]
+
+    def select(self, indexes):
+        """New LogColumns containing only the records at indexes (in that order)"""
+        columns = LogColumns()
+        columns.names = self.names
+        columns._name_index = self._name_index
+        messages = [self.message(index) for index in indexes]
+        columns.seconds = array('d', (self.seconds[index] for index in indexes))
+        columns.levels = array('H', (self.levels[index] for index in indexes))
+        columns.name_ids = array('I', (self.name_ids[index] for index in indexes))
+        columns._buffer = "".join(messages)
+        offsets, position = [0], 0
+        for message in messages:
+            position += len(message)
+            offsets.append(position)
+        columns.offsets = array('Q', offsets)
+        return columns
+
+    def save(self, path: Path, key: list):
+        """
+        Write columns to a binary file: a JSON header line (key, counts, names),
+        then each array written with array.tofile, then the buffer as UTF-8
+        """
+        buffer = self.buffer.encode('utf-8', errors='surrogatepass')
+        header = {"key": key, "count": len(self), "buffer_size": len(buffer), "names": self.names}
+        with open(path, mode='wb') as file:
+            file.write(json.dumps(header).encode('utf-8') + b"\n")
+            for column in (self.seconds, self.levels, self.name_ids, self.offsets):
+                column.tofile(file)
+            file.write(buffer)
+
+    @classmethod
+    def load(cls, path: Path, key: list):
+        """Read columns written by .save() or return None if its key doesn't match"""
+        columns = cls()
+        with open(path, mode='rb') as file:
+            header = json.loads(file.readline())
+            if header["key"] != key:
+                return None
+            count = header["count"]
+            for column, size in ((columns.seconds, count), (columns.levels, count),
+                                 (columns.name_ids, count)):
+                column.fromfile(file, size)
+            columns.offsets = array('Q')
+            columns.offsets.fromfile(file, count + 1)
+            buffer = file.read(header["buffer_size"])
+        if len(buffer) != header["buffer_size"]:
+            raise EOFError(f"Incomplete columns file {path}")
+        columns._buffer = buffer.decode('utf-8', errors='surrogatepass')
+        columns.names = header["names"]
+        columns._name_index = {name: index for index, name in enumerate(columns.names)}
+        return columns
+
+
 class Log():
     """
     Convenience class for creating and using logging objects e.g.
@@ -48,11 +380,12 @@ class Log():
     path = Path.cwd()
     mode = "a"
     backup_count = 0
+    queued = False
 
     def __init__(self, name, **kwargs):
         self.name = name
         self.logger = logging.getLogger(self.name)
-        for key in "path level fmt datefmt to_file to_stdout mode backup_count".split():
+        for key in "path level fmt datefmt to_file to_stdout mode backup_count queued".split():
             value = kwargs.get(key) if key in kwargs else getattr(Log, key)
             setattr(self, key, value)
         self.path = Path(self.path)
@@ -64,10 +397,19 @@ class Log():
         if kwargs.get("to_file") and "to_stdout" not in kwargs:
             self.to_stdout = False
 
+        if Log.index.get(self.name):
+            Log.index[self.name].stop_writer()
         while len(self.logger.handlers) > 0:
             self.logger.removeHandler(self.logger.handlers[0])
 
-        for handler in self.get_handlers():
+        handlers = self.get_handlers()
+        self.listener = None
+        if self.queued:   # Hand records to a background thread which does the writing
+            self.queue = queue.Queue()
+            self.listener = logging.handlers.QueueListener(self.queue, *handlers, respect_handler_level=True)
+            self.listener.start()
+            handlers = [logging.handlers.QueueHandler(self.queue)]
+        for handler in handlers:
             self.logger.addHandler(handler)
         setattr(Log, self.name, self.logger)
         Log.index[self.name] = self
@@ -95,6 +437,35 @@ class Log():
             handlers += [handler]
         return handlers
 
+    def flush(self):
+        """Wait until any queued messages have been written, then flush all handlers"""
+        handlers = self.logger.handlers
+        if self.listener:
+            self.queue.join()
+            handlers = self.listener.handlers
+        for handler in handlers:
+            handler.flush()
+
+    def stop_writer(self):
+        """
+        Write any queued messages and stop the background writer thread.
+        Later messages are written directly by the logger's handlers
+        """
+        if self.listener:
+            # Attach the direct handlers first, so records from other threads always have a handler
+            for handler in self.listener.handlers:
+                self.logger.addHandler(handler)
+            for handler in self.logger.handlers[:]:
+                if isinstance(handler, logging.handlers.QueueHandler):
+                    self.logger.removeHandler(handler)
+            self.listener.stop()
+            self.listener = None
+            self.queued = False
+
+    async def aflush(self):
+        """Awaitable flush() which doesn't block the event loop"""
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
     def add_level(self, level_name, level_value=20, below="", above=""):
         """
         Add a custom log level at a specific numeric value or below/above
@@ -117,9 +488,70 @@ class Log():
         setattr(self.logger, lower_name, log_message)
         return f"New log level '{lower_name}' added with value: {level_value}"
 
+    def log_many(self, level, messages=None):
+        """
+        Log a batch of messages in one call e.g.
+
+        mylog.log_many("info", ["Row 1 OK", "Row 2 OK"])
+        mylog.log_many([("info", "Row 1 OK"), ("error", "Row 2 failed")])
+
+        Records are created in bulk, formatted in one pass and written to
+        each handler (respecting its level) in a single write.
+        """
+        if (messages is None and isinstance(level, (str, int))) or isinstance(messages, str):
+            raise TypeError("log_many() takes a level and a list of messages, "
+                            "or a list of (level, message) pairs")
+        pairs = level if messages is None else ((level, message) for message in messages)
+        logger = self.logger
+        caller = sys._getframe(1)   # findCaller(stacklevel=) isn't reliable before Python 3.11
+        fn, lno, func, sinfo = caller.f_code.co_filename, caller.f_lineno, caller.f_code.co_name, None
+        records = []
+        for record_level, message in pairs:
+            level_int = record_level if isinstance(record_level, int) else getattr(logging, record_level.upper())
+            if logger.isEnabledFor(level_int):
+                record = logger.makeRecord(logger.name, level_int, fn, lno, message, (), None, func, None, sinfo)
+                if not logger.filters or logger.filter(record):
+                    records.append(record)
+        if not records:
+            return
+        found = 0
+        while logger:
+            for handler in logger.handlers:
+                found += 1
+                self._emit_many(handler, records)
+            logger = logger.parent if logger.propagate else None
+        if not found and logging.lastResort:
+            self._emit_many(logging.lastResort, records)
+
+    @staticmethod
+    def _emit_many(handler, records):
+        """Write all records at or above the handler's level with a single write"""
+        records = [record for record in records if record.levelno >= handler.level
+                   and (not handler.filters or handler.filter(record))]
+        if not records:
+            return
+        batchable = type(handler) in (logging.StreamHandler, logging.FileHandler) or (
+            type(handler) is logging.handlers.RotatingFileHandler and handler.maxBytes == 0)
+        if not batchable:
+            for record in records:  # Handler may need each record e.g. to rotate its file
+                handler.handle(record)
+            return
+        handler.acquire()
+        try:
+            text = "".join([handler.format(record) + handler.terminator for record in records])
+            if isinstance(handler, logging.FileHandler) and handler.stream is None:
+                handler.stream = handler._open()
+            handler.stream.write(text)
+            handler.flush()
+        except Exception:
+            handler.handleError(records[0])
+        finally:
+            handler.release()
+
     @ClassOrMethod
     def find(self, text: str="", path=None, date=None, deltadays: int=-7, level: str='NOTSET',
-                ignorecase: bool=True):
+                ignorecase: bool=True, as_columns: bool=False, cache: bool=True, workers: int=1,
+                last: int=None):
         """ Search log for:
                text:        text to seach for. Default '' means return everything
                path:        FULL 'path/to/another/log.log' to search. Default=None, search this log
@@ -127,19 +559,17 @@ class Log():
                deltadays:   number of days prior to (-ve) or after date. Default 1 week prior
                level:       log level below which results are ignored. Default 'NOTSET'
                ignorecase:  set case insensitivity. Default True
+               as_columns:  return a LogColumns object instead of a list. Default False
+               cache:       with as_columns, keep parsed columns in a 'log.log.cols' file
+                            alongside the log so repeat searches skip parsing. Default True
+               workers:     number of processes to search a (large) log with, each taking
+                            a separate part of the file. Default 1.  On Windows and macOS
+                            the calling script needs an  if __name__ == "__main__":  guard
+               last:        only return the last N matching records, reading the log
+                            backwards from the end (ignores workers). Default None = all
             Returns [MSG[, ...]], [error message] or []
         """
 
-        def _check_path(path: str) -> path:
-            """ Get the logs path name and check the log exists"""
-            if path is None:
-                full_path = Path(self.path, f"{self.name}.log")
-            else:
-                full_path = Path(path)
-            if not full_path.is_file():
-                raise Exception(f'No log file at {full_path}')
-            return full_path
-
         def _get_search_dates(date, deltadays) -> tuple:
             """Get the start and end dates/times for the search period"""
             try:
@@ -156,96 +586,177 @@ class Log():
                 raise Exception(f"Find start/End date error: {date}|{deltadays}")
             return (start_date, end_date)
 
-        def _get_line_date(line:str) -> datetime:
-            """Get any datetime that exists on a log line or return None"""
-            try:
-                linedate = parser.parse(line, fuzzy=True, ignoretz=True)
-            except Exception as excpt:  # Timestamp/level not found or multiple numbers
-                linedate = None  # remove any old value
-                if "Unknown string" in excpt.args[0]:  # here if multiple numbers found
-                    linedate = _get_difficult_date(line)
-            return linedate
-
-        def _get_difficult_date(line: str) -> datetime:
-            """If line contains more than 1 group of numbers parser.parse alone fails"""
-            try:
-                re_date = _date_regex.search(line)
-                return parser.parse(re_date.group(0), fuzzy=True, ignoretz=True)
-            except:
-                return None
+        def _get_line_name(line: str) -> str:
+            """Returns logger name found on this line or '' """
+            if _name_field is None:
+                return ""
+            fields = line.split("|", _field_count - 1)
+            return fields[_name_field].strip() if _name_field < len(fields) else ""
 
-        def _get_search_level(level) -> int:
-            """Get the minimum search level as an int"""
-            try:
-                return _log_levels[level.upper()]  # log level to search for
-            except:
-                return 0
-
-        def _get_line_level(line: str) -> str:
-            """Returns level found on this line or '' """
-            for level in _log_levels:
-                if level in line:
-                    return level
-            return ""
-
-        def _query_level(level_str: str) -> bool:
-            """Is record above required level? Return True/False """
-            if level_str:
-                level_not_found = 50  # i.e. CRITICAL
-                return _log_levels.get(level_str, level_not_found) >= _search_level
-            return True   #  Level was ""
-
-        def _query_text(line: str) -> bool:
-            """Does record contain text? Return True/False"""
-            if _search_text:
-                try:
-                    return (_search_text in line.casefold()) if _ignorecase else (_search_text in line)
-                except:
-                    return False  # TODO: should we return True?
-            return True   # search text was ""
+        def _parse_columns():
+            """Parse every record in the log into columns"""
+            columns = LogColumns()
+            with open(_log_path, mode='r') as _log_file:
+                for _timestamp, record in _iter_records(_log_file):
+                    columns.append(_timestamp, _get_line_level(record), _get_line_name(record), record)
+            return columns
 
-        def _query_save(line: str) -> bool:
-            """Check if line should be saved and returns True/False """
-            if line:
-                _level = _get_line_level(line)
-                return _query_level(_level) and _query_text(line)
-            return False
+        def _load_columns():
+            """Load columns from the binary sidecar if up to date, else parse (and save) them"""
+            sidecar = Path(f"{_log_path}.cols")
+            stat = _log_path.stat()
+            key = [LogColumns.version, stat.st_size, stat.st_mtime_ns, self.fmt, sorted(_log_levels.items()),
+                   sys.byteorder, [column.itemsize for column in (array('H'), array('I'), array('Q'))]]
+            key = json.loads(json.dumps(key))   # lists, as read back from the sidecar header
+            if cache and sidecar.is_file():
+                try:
+                    columns = LogColumns.load(sidecar, key)
+                    if columns is not None:
+                        return columns
+                except Exception:
+                    pass  # Unreadable or out of date sidecar - parse the log again
+            columns = _parse_columns()
+            if cache:
+                try:
+                    columns.save(sidecar, key)
+                except OSError:
+                    pass  # e.g. read only folder - just don't cache
+            return columns
 
+        def _query_columns(columns, index: int) -> bool:
+            """Check if column record should be saved and returns True/False """
+            level_value = columns.levels[index]
+            if level_value != LogColumns.no_level and level_value < _search_level:
+                return False
+            return _query_text(columns.message(index), _search_text, _ignorecase)
 
         # Get the arguments
         _ignorecase = ignorecase
         _search_text = text.casefold() if _ignorecase else text  # text to search for
-        _log_path = _check_path(path)   # path for file to search
+        _log_path = _check_path(self, path)   # path for file to search
         _start_date, _end_date = _get_search_dates(date, deltadays)   # date interval
         _log_levels = logging._nameToLevel   # all log level names
         _search_level = _get_search_level(level)  # log level to exceed, 0 if no level specified
-        _date_pattern = "(\d\d:\d\d:\d\d([T ]|'T')?)?\d{1,4}[./-]\d{1,2}[./-]\d{1,4}(([T ]|'T')\d\d:\d\d:\d\d)?"
-        _date_regex = re.compile(_date_pattern)
-        # Initialise
-        result = []
-        line_to_save = ""
+        if last is not None and last < 0:
+            raise ValueError(f"Find last must be 0 or more: {last}")
+        _query = (_search_text, _ignorecase, _search_level, dict(_log_levels))
+        _fmt_fields = self.fmt.split("|")
+        _field_count = len(_fmt_fields)
+        _name_field = _fmt_fields.index("%(name)s") if "%(name)s" in _fmt_fields else None
 
-        # ...and search the file
-        with open(_log_path, mode='r') as _log_file:
-            for new_line in _log_file:
-                # Get timestamp
-                _timestamp = _get_line_date(new_line)
-                if _timestamp is None: # then this is a multiline record
-                    line_to_save = line_to_save + new_line if line_to_save else ''
-                #  within time period?
-                elif _timestamp >= _start_date:
-                    if _query_save(line_to_save):  # previous record may need saving
-                        result.append(line_to_save)
-                        line_to_save = ''
-                    if _timestamp > _end_date:     # Past end time - No need to read any more
+        if as_columns:
+            columns = _load_columns()
+            _start, _end = _get_seconds(_start_date), _get_seconds(_end_date)
+            indexes = []
+            for index, seconds in enumerate(columns.seconds):
+                if seconds > _end:     # Past end time - No need to look any further
+                    break
+                if seconds >= _start and _query_columns(columns, index):
+                    indexes.append(index)
+            return columns.select(indexes[max(len(indexes) - last, 0):] if last is not None else indexes)
+
+        # ...or search backwards from the end of the file
+        if last is not None:
+            result = []
+            if last == 0:
+                return result
+            with open(_log_path, mode='rb') as _log_file:
+                for _timestamp, record in _iter_records_reversed(_read_lines_reversed(_log_file)):
+                    if _timestamp < _start_date:     # Before start time - No need to read any more
                         break
-                    # Start next record to save?
-                    line_to_save = new_line
-        # Check we got last line of file
-        if _query_save(line_to_save):
-            result.append(line_to_save)
+                    if _timestamp <= _end_date and _query_save(record, *_query):
+                        result.append(record)
+                        if len(result) == last:
+                            break
+            return result[::-1]
+
+        # ...or search parts of the file in parallel
+        if workers > 1:
+            result = []
+            chunks = _get_chunks(_log_path, workers * 4, _start_date, _end_date)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_find_chunk, _log_path, begin, stop, _start_date, _end_date, _query)
+                           for begin, stop in chunks]
+                for future in futures:
+                    records, past_end = future.result()
+                    result += records
+                    if past_end:     # No need to read any more
+                        for pending in futures:
+                            pending.cancel()
+                        break
+            return result
+
+        # ...or search the file
+        result = []
+        with open(_log_path, mode='r') as _log_file:
+            for _timestamp, record in _iter_records(_log_file):
+                if _timestamp > _end_date:     # Past end time - No need to read any more
+                    break
+                if _timestamp >= _start_date and _query_save(record, *_query):
+                    result.append(record)
         return result
 
+    @ClassOrMethod
+    def to_columns(self, text: str="", path=None, date=None, deltadays: int=-7, level: str='NOTSET',
+                ignorecase: bool=True, cache: bool=True, last: int=None):
+        """
+        Shortcut for find(..., as_columns=True) e.g.
+
+        columns = mylog.to_columns(level="error", deltadays=-31)
+        """
+        return self.find(text, path, date, deltadays, level, ignorecase, as_columns=True, cache=cache, last=last)
+
+    @ClassOrMethod
+    async def afind(self, *args, **kwargs):
+        """
+        Awaitable find() which searches in a separate thread so the event loop
+        isn't blocked e.g.
+
+        errors = await mylog.afind(level="error", last=50)
+
+        Returns the same list as find() once the search is complete - results
+        aren't streamed back in batches, so use last=N to limit large results.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, partial(self.find, *args, **kwargs))
+
+    @ClassOrMethod
+    async def afollow(self, text: str="", path=None, level: str='NOTSET', ignorecase: bool=True,
+                      interval: float=0.5):
+        """
+        Async iterator of records as they are added to the log, like 'tail -f' e.g.
+
+        async for record in mylog.afollow(level="error"):
+            print(record)
+
+        text, path, level and ignorecase work as for find.  The log is checked
+        for new records every interval seconds, reading in a separate thread.
+        A record is yielded when the next one starts, or once nothing more has
+        been added for interval seconds, so multiline records arrive whole.
+        """
+        log_path = _check_path(self, path)
+        search_text = text.casefold() if ignorecase else text
+        query = (search_text, ignorecase, _get_search_level(level), dict(logging._nameToLevel))
+        loop = asyncio.get_running_loop()
+        with open(log_path, mode='rb') as log_file:
+            log_file.seek(0, 2)
+            unfinished = b""   # last line, if not completely written yet
+            pending = None     # last record, which may not be complete yet
+            quiet = False      # True once a check found nothing new
+            while True:
+                records, unfinished, pending, new_data = await loop.run_in_executor(
+                    None, _read_new_records, log_file, unfinished, pending, query)
+                for record in records:
+                    yield record
+                if new_data:
+                    quiet = False
+                    continue
+                if pending and quiet:   # Nothing added for interval seconds - record is complete
+                    record, pending = pending[1], None
+                    if _query_save(record, *query):
+                        yield record
+                quiet = True
+                await asyncio.sleep(interval)
+
     def __call__(self, *args, **kwargs):
         """
         Shortcut to log at effective logging level using easy syntax e.g.
@@ -285,3 +796,10 @@ class Log():
         root = logging.Logger.root
         for handler in root.handlers:
             root.removeHandler(handler)
+
+
+@atexit.register
+def _stop_writers():
+    """Write any queued messages before Python exits"""
+    for log in list(Log.index.values()):
+        log.stop_writer()
@@ -1,3 +1,6 @@
+import asyncio
+import sys
+import time
 from functools import wraps
 import pytest
 import logging
@@ -146,3 +149,140 @@ def test_set_level() -> bool:
     mylog.logger.critical(f"{msg}: Fail!")
 
 
+
+@create_mylog
+def test_log_many():
+    mylog.log_many("info", ["Row 1 OK", "Row 2 OK"])
+    mylog.log_many([("warning", "Row 3 odd"), (logging.ERROR, "Row 4 failed"), ("debug", "Row 5 OK")])
+    lines = Path("mylog.log").read_text().splitlines()
+    assert [line.split("|")[-1] for line in lines] == ["Row 1 OK", "Row 2 OK", "Row 3 odd", "Row 4 failed", "Row 5 OK"]
+    assert [line.split("|")[1].strip() for line in lines] == ["INFO", "INFO", "WARNING", "ERROR", "DEBUG"]
+
+@create_mylog
+def test_log_many_needs_messages():
+    with pytest.raises(TypeError):
+        mylog.log_many("info")
+    with pytest.raises(TypeError):
+        mylog.log_many(logging.INFO)
+    with pytest.raises(TypeError):
+        mylog.log_many("info", "Row 1 OK")
+
+def test_log_many_caller():
+    fmt = "%(funcName)s|%(lineno)d|%(message)s"
+    mylog = Log("mylog", to_file=True, mode="w", fmt=fmt)
+    def caller():
+        line = sys._getframe().f_lineno + 1
+        mylog.log_many("info", ["Row 1 OK", "Row 2 OK"])
+        return line
+    line = caller()
+    lines = Path("mylog.log").read_text().splitlines()
+    assert lines == [f"caller|{line}|Row 1 OK", f"caller|{line}|Row 2 OK"], f"Found {lines}"
+    cleanup()
+
+def test_log_many_handler_levels(capfd):
+    mylog = Log("mylog", to_file=True, to_stdout=True, mode="w", level="info")
+    mylog.logger.handlers[1].setLevel(logging.ERROR)  # stdout: errors only
+    mylog.log_many([("debug", "Hidden"), ("info", "File only"), ("error", "Everywhere")])
+    out, err = capfd.readouterr()
+    assert out.endswith("|Everywhere\n") and "File only" not in out
+    text = Path("mylog.log").read_text()
+    assert "File only" in text and "Everywhere" in text and "Hidden" not in text
+    cleanup()
+
+def test_queued_aflush():
+    mylog = Log("mylog", to_file=True, mode="w", queued=True)
+    async def main():
+        for index in range(1000):
+            mylog(f"Message {index}")
+        await mylog.aflush()
+        return Path("mylog.log").read_text().splitlines()
+    lines = asyncio.run(main())
+    mylog.stop_writer()
+    assert len(lines) == 1000
+    assert lines[-1].endswith("|Message 999")
+    cleanup()
+
+def test_stop_writer():
+    mylog = Log("mylog", to_file=True, mode="w", queued=True)
+    mylog("Before stopping")
+    mylog.stop_writer()
+    mylog("After stopping")
+    mylog.flush()
+    lines = Path("mylog.log").read_text().splitlines()
+    assert [line.split("|")[-1] for line in lines] == ["Before stopping", "After stopping"]
+    assert not any(isinstance(x, logging.handlers.QueueHandler) for x in mylog.logger.handlers)
+    mylog = Log("mylog", to_file=True, mode="a", queued=True)
+    mylog = Log("mylog", to_file=True, mode="a", queued=True)
+    assert len(mylog.logger.handlers) == 1, f"Old handlers kept: {mylog.logger.handlers}"
+    mylog.stop_writer()
+    cleanup()
+
+class SlowHandler(logging.Handler):
+    """Handler with slow output e.g. a busy disk or network share"""
+    def __init__(self, delay=0.01):
+        super().__init__()
+        self.delay = delay
+        self.records = []
+
+    def emit(self, record):
+        time.sleep(self.delay)
+        self.records.append(record)
+
+class SlowLog(Log):
+    def get_handlers(self):
+        return [SlowHandler()]
+
+def test_stop_writer_while_logging():
+    """Messages logged by another thread while the writer stops all reach a handler"""
+    import threading
+    handler = SlowHandler(delay=0.002)
+    class CollectingLog(Log):
+        def get_handlers(self):
+            return [handler]
+    mylog = CollectingLog("mylog", level="info", queued=True)
+    def log_messages():
+        for index in range(200):
+            mylog.logger.info(f"Message {index}")
+            time.sleep(0.001)
+    thread = threading.Thread(target=log_messages)
+    thread.start()
+    time.sleep(0.05)
+    mylog.stop_writer()
+    thread.join()
+    messages = {record.getMessage() for record in handler.records}
+    missing = {f"Message {index}" for index in range(200)} - messages
+    assert not missing, f"{len(missing)} messages not written"
+    cleanup()
+
+def longest_event_loop_gap(log) -> float:
+    """Longest time the event loop is blocked while log gets 100 messages in batches of 20"""
+    async def heartbeat(gaps, stop):
+        while not stop.is_set():
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            gaps.append(time.perf_counter() - before)
+    async def main():
+        gaps, stop = [], asyncio.Event()
+        task = asyncio.create_task(heartbeat(gaps, stop))
+        for batch in range(5):
+            for index in range(20):
+                log(f"Batch {batch} message {index}")
+            await asyncio.sleep(0)
+        await log.aflush()
+        stop.set()
+        await task
+        return max(gaps)
+    return asyncio.run(main())
+
+def test_queued_event_loop_latency():
+    """Slow writes block the event loop unless the log is queued"""
+    slow_log = SlowLog("mylog", queued=False)
+    gap = longest_event_loop_gap(slow_log)
+    assert gap > 0.1, f"Expected unqueued log to block the event loop, longest gap {gap:.3f}s"
+    slow_log = SlowLog("mylog", queued=True)
+    gap = longest_event_loop_gap(slow_log)
+    assert gap < 0.1, f"Event loop blocked for {gap:.3f}s"
+    handler = slow_log.listener.handlers[0]
+    slow_log.stop_writer()
+    assert len(handler.records) == 100, f"Expected 100, found {len(handler.records)}"
+    cleanup()
@@ -5,6 +5,8 @@ pytest module for "Find" function testing
 
 """
 
+import asyncio
+import json
 import logging
 import time
 from datetime import datetime, timedelta
@@ -13,7 +15,7 @@ from pathlib import Path
 
 import pytest
 
-from log2d import Log
+from log2d import Log, LogColumns
 
 
 def cleanup():
@@ -32,6 +34,9 @@ def cleanup():
     if path.is_file():
         print("Deleting: mylog.log")
         path.unlink()
+    sidecar = Path("mylog.log.cols")
+    if sidecar.is_file():
+        sidecar.unlink()
 
 def create():
     """
@@ -264,4 +269,169 @@ def test_find_userlevel():
     assert len(result) == 4, expected(4, len(result))
 
 
+@create_mylog
+def test_find_as_columns():
+    """Columns hold the same records as a normal find"""
+    create_dummy_log()
+    mylog.logger.error("Message: Last line")
+    with open("mylog.log", "a") as log_file:
+        log_file.write(f"mylog|NOTSET  |{datetime.now():%Y-%m-%dT%H:%M:%S}|Message: Not set\n")
+    for kwargs in [{}, {"level": "info"}, {"level": "error"}, {"text": "message #1"}, {"deltadays": -3}]:
+        result = mylog.find(**kwargs)
+        columns = mylog.find(as_columns=True, **kwargs)
+        assert list(columns) == result, f"{kwargs}: {expected(result, list(columns))}"
+        assert len(columns) == len(result), expected(len(result), len(columns))
+    columns = Log.to_columns(path="mylog.log", level="error")
+    assert all(x in (LogColumns.no_level, 40, 50) for x in columns.levels), f"Level below ERROR: {columns.levels}"
+    assert [columns.names[x] for x in columns.name_ids][-1] == "mylog", "Name not encoded"
+    assert mylog.to_columns(text="not set").levels[0] == 0, "NOTSET not stored as 0"
+    assert set(columns.names) == {"MyTestApp", "mylog"}, expected({"MyTestApp", "mylog"}, columns.names)
+    assert list(columns.seconds) == sorted(columns.seconds), "Timestamps out of order"
+
+@create_mylog
+def test_find_columns_datetime64():
+    """With numpy installed, timestamps are datetime64 - including when nothing matches"""
+    numpy = pytest.importorskip("numpy")
+    create_dummy_log()
+    columns = mylog.to_columns()
+    assert columns.timestamps.dtype == numpy.dtype('datetime64[us]')
+    first = columns.timestamps[0].astype(datetime)
+    assert first.strftime("%Y/%m/%dT%H:%M:%S") == columns.message(0).split("|")[2][:19]
+    empty = mylog.to_columns(text="no such message")
+    assert len(empty) == 0 and len(empty.timestamps) == 0
+    assert empty.timestamps.dtype == numpy.dtype('datetime64[us]')
+
+@create_mylog
+def test_find_columns_sidecar():
+    """Columns are cached in a sidecar file and refreshed when the log changes"""
+    create_dummy_log()
+    sidecar = Path("mylog.log.cols")
+    assert len(mylog.to_columns(cache=False)) == 6
+    assert not sidecar.is_file(), "Sidecar written with cache=False"
+    assert len(mylog.to_columns()) == 6
+    assert sidecar.is_file(), "No sidecar written"
+    header = json.loads(sidecar.read_bytes().split(b"\n", 1)[0])
+    assert header["count"] == 10 and header["names"] == ["MyTestApp"], f"Unexpected header {header}"
+    assert list(mylog.to_columns()) == mylog.find(), "Sidecar columns differ from log"
+    errors = len(mylog.find(level="error"))
+    assert len(mylog.to_columns(level="error")) == errors, expected(errors, "?")
+    mylog.logger.error("Message: Last line")
+    assert len(mylog.to_columns(level="error")) == errors + 1, "Sidecar not refreshed"
+
+@create_mylog
+def test_find_workers():
+    """Parallel search gives the same records, in the same order, as a normal find"""
+    create_dummy_log(delta=200)
+    mylog.logger.error("Message: Last line\n  with a second line")
+    for kwargs in [{}, {"deltadays": -100}, {"deltadays": -365, "level": "error"},
+                   {"deltadays": -365, "text": "message #1"},
+                   {"date": datetime.now() - timedelta(days=150), "deltadays": -20}]:
+        result = mylog.find(**kwargs)
+        parallel = mylog.find(workers=3, **kwargs)
+        assert parallel == result, f"{kwargs}: {expected(result, parallel)}"
+    assert mylog.find(workers=2)[-1].endswith("with a second line\n"), "Multiline record split"
+
+@create_mylog
+def test_find_last():
+    """Reading backwards gives the same records as the end of a normal find"""
+    create_dummy_log(delta=200)
+    mylog.logger.error("Message: Last line\n  with a second line")
+    for kwargs in [{}, {"deltadays": -365, "level": "error"}, {"deltadays": -365, "text": "message #1"},
+                   {"date": datetime.now() - timedelta(days=150), "deltadays": -20}]:
+        result = mylog.find(**kwargs)
+        for last in (1, 3, 1000):
+            assert mylog.find(last=last, **kwargs) == result[-last:], f"{kwargs} last={last}"
+            assert list(mylog.to_columns(last=last, **kwargs)) == result[-last:], f"{kwargs} last={last}"
+    assert mylog.find(last=0) == [], "Expected no records for last=0"
+    assert len(mylog.to_columns(last=0)) == 0, "Expected no columns for last=0"
+    with pytest.raises(ValueError):
+        mylog.find(last=-1)
+    with pytest.raises(ValueError):
+        mylog.to_columns(last=-1)
+    result = mylog.find(last=1)
+    assert result[0].startswith("mylog|ERROR"), f"Expected last record, found {result}"
+    assert result[0].endswith("with a second line\n"), "Multiline record split"
+
+def test_read_lines_reversed():
+    """Lines split across blocks are joined back together"""
+    import io
+    from log2d import _read_lines_reversed
+    text = b"first line\nsecond\r\nthird line is longer\n\nlast"
+    for block_size in (1, 3, 7, 1000):
+        lines = list(_read_lines_reversed(io.BytesIO(text), block_size))
+        assert lines == ["last", "\n", "third line is longer\n", "second\n", "first line\n"], f"{block_size}: {lines}"
+
+@create_mylog
+def test_afind():
+    """Awaitable find gives the same results"""
+    create_dummy_log()
+    async def main():
+        return await mylog.afind(level="error"), await Log.afind(path="mylog.log", last=1)
+    result, last = asyncio.run(main())
+    assert result == mylog.find(level="error"), expected(mylog.find(level="error"), result)
+    assert last == mylog.find(last=1), expected(mylog.find(last=1), last)
+
+@create_mylog
+def test_afollow():
+    """Follow new records as they are logged"""
+    create_dummy_log()
+    async def main():
+        records = []
+        async def follow():
+            new_records = mylog.afollow(level="error", interval=0.01)
+            async for record in new_records:
+                records.append(record)
+                if len(records) == 2:
+                    break
+            await new_records.aclose()
+        task = asyncio.create_task(follow())
+        await asyncio.sleep(0.1)   # let afollow reach the end of the log
+        mylog.logger.info("Not an error")
+        mylog.logger.error("First error\n  on two lines")
+        mylog.logger.error("Second error")
+        await asyncio.wait_for(task, 5)
+        return records
+    records = asyncio.run(main())
+    assert len(records) == 2, expected(2, len(records))
+    assert records[0].endswith("|First error\n  on two lines\n"), f"Found {records[0]}"
+    assert records[1].endswith("|Second error\n"), f"Found {records[1]}"
+
+@create_mylog
+def test_read_new_records():
+    """A record written in two parts is only complete once the next record starts"""
+    from log2d import _read_new_records
+    query = ("", True, 0, dict(logging._nameToLevel))
+    timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+    with open("mylog.log", "ab") as writer, open("mylog.log", "rb") as reader:
+        writer.write(f"mylog|ERROR   |{timestamp}|Traceback:\n".encode())
+        writer.flush()
+        records, unfinished, pending, new_data = _read_new_records(reader, b"", None, query)
+        assert records == [] and new_data, f"Found {records}"
+        writer.write(b"  File x\n  ValueError")
+        writer.flush()
+        records, unfinished, pending, new_data = _read_new_records(reader, unfinished, pending, query)
+        assert records == [] and unfinished == b"  ValueError", f"Found {records}, {unfinished}"
+        writer.write(f"\nmylog|INFO    |{timestamp}|Next\n".encode())
+        writer.flush()
+        records, unfinished, pending, new_data = _read_new_records(reader, unfinished, pending, query)
+    assert records == [f"mylog|ERROR   |{timestamp}|Traceback:\n  File x\n  ValueError\n"], f"Found {records}"
+    assert pending[1].endswith("|Next\n"), f"Found {pending}"
+
+@create_mylog
+def test_afollow_record_in_two_writes():
+    """afollow yields a record written in two parts once nothing more is added"""
+    async def main():
+        new_records = mylog.afollow(level="error", interval=0.3)
+        task = asyncio.create_task(new_records.__anext__())
+        await asyncio.sleep(0.1)   # let afollow reach the end of the log
+        with open("mylog.log", "a") as log_file:
+            log_file.write(f"mylog|ERROR   |{datetime.now():%Y-%m-%dT%H:%M:%S}|Traceback:\n")
+            log_file.flush()
+            await asyncio.sleep(0.3)   # afollow reads the first part
+            log_file.write("  File x\n  ValueError\n")
+        record = await asyncio.wait_for(task, 5)
+        await new_records.aclose()
+        return record
+    record = asyncio.run(main())
+    assert record.endswith("|Traceback:\n  File x\n  ValueError\n"), f"Found {record}"
 